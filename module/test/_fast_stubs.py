@@ -0,0 +1,82 @@
+"""
+测试用轻量桩对象
+以普通属性和列表记录调用，替代不需要side_effect或调用断言的MagicMock，
+减少测试中的mock构造与属性自动创建开销。
+"""
+# pylint: disable=too-few-public-methods
+from module.config import Config
+
+
+class FakeConfig:
+    """配置桩，以类属性提供翻译器管理器用到的默认配置，实例可按需覆盖"""
+    DASHSCOPE_API_KEY = "test_api_key"
+    SAMPLE_RATE = 16000
+    ASR_LANGUAGE = "zh-CN"
+    TRANSLATE_TARGET = "en"
+    LANGUAGE = Config.LANGUAGE_CHINESE
+    HEARTBEAT_INTERVAL = 5
+
+    def __init__(self, **overrides):
+        for key, value in overrides.items():
+            setattr(self, key, value)
+
+
+class FakeLogger:
+    """日志桩，按级别记录日志消息"""
+    __slots__ = ('info_calls', 'warning_calls', 'error_calls', 'debug_calls')
+
+    def __init__(self):
+        self.info_calls = []
+        self.warning_calls = []
+        self.error_calls = []
+        self.debug_calls = []
+
+    def info(self, message):
+        """记录info日志"""
+        self.info_calls.append(message)
+
+    def warning(self, message):
+        """记录warning日志"""
+        self.warning_calls.append(message)
+
+    def error(self, message):
+        """记录error日志"""
+        self.error_calls.append(message)
+
+    def debug(self, message):
+        """记录debug日志"""
+        self.debug_calls.append(message)
+
+
+class FakeCallback:
+    """回调桩，记录每次调用的参数"""
+    __slots__ = ('calls',)
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        """记录本次调用的位置参数与关键字参数"""
+        self.calls.append((args, kwargs))
+
+
+class FakeTranslator:
+    """翻译器桩，记录启动、停止次数及发送的音频帧"""
+    __slots__ = ('start_count', 'stop_count', 'frames')
+
+    def __init__(self):
+        self.start_count = 0
+        self.stop_count = 0
+        self.frames = []
+
+    def start(self):
+        """记录启动"""
+        self.start_count += 1
+
+    def stop(self):
+        """记录停止"""
+        self.stop_count += 1
+
+    def send_audio_frame(self, audio_data):
+        """记录发送的音频帧"""
+        self.frames.append(audio_data)
@@ -1,4 +1,5 @@
 import unittest
+import copy
 import sys
 import os
 import threading
@@ -11,9 +12,20 @@ from PyQt5 import QtWidgets
 # 添加上级目录到系统路径，以便正确导入module包
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from module.translator_manager import TranslatorManager
+from module.translator_manager import TranslatorManager, TranslatorState, _WAKEUP_FRAME
+from module.translator_status import TranslatorStatus
 from module.config import Config
+from module.info import INFO
 from module.logger import Logger
+from module.test._fast_stubs import FakeConfig, FakeLogger, FakeCallback, FakeTranslator
+
+# 测试共用的只读音频数据，避免每个测试重复构造numpy数组
+_TEST_AUDIO_I16 = np.array([[1, 2], [3, 4]], dtype=np.int16)
+_TEST_AUDIO_I16.setflags(write=False)
+# 缓冲区中实际存放的是process_audio转换后的字节数据
+_TEST_AUDIO_BYTES = _TEST_AUDIO_I16.tobytes()
+_TEST_AUDIO_F32 = np.zeros((1024,), dtype=np.float32)
+_TEST_AUDIO_F32.setflags(write=False)
 
 
 class TestTranslatorManager(unittest.TestCase):
@@ -21,20 +33,14 @@ class TestTranslatorManager(unittest.TestCase):
 
     def setUp(self):
         """测试前的准备工作"""
-        # 创建配置对象的模拟
-        self.config = MagicMock()
-        self.config.DASHSCOPE_API_KEY = "test_api_key"
-        self.config.SAMPLE_RATE = 16000
-        self.config.ASR_LANGUAGE = "zh-CN"
-        self.config.TRANSLATE_TARGET = "en"
-        self.config.LANGUAGE = Config.LANGUAGE_CHINESE
-        self.config.HEARTBEAT_INTERVAL = 5
-
-        # 创建日志记录器的模拟
+        # 创建配置对象的桩
+        self.config = FakeConfig()
+
+        # 创建日志记录器的模拟（多数测试需要对其调用进行断言）
         self.logger = MagicMock(spec=Logger)
 
-        # 创建回调函数的模拟
-        self.realtime_callback = MagicMock()
+        # 创建回调函数的桩
+        self.realtime_callback = FakeCallback()
 
         # 创建应用实例，避免PyQt5的一些错误
         self.app = QtWidgets.QApplication.instance()
@@ -97,7 +103,7 @@ class TestTranslatorManager(unittest.TestCase):
 
         # 验证初始状态
         self.assertFalse(manager.state['running'])
-        self.assertEqual(manager.state['translator_status'], "initialized")
+        self.assertEqual(manager.state['translator_status'], TranslatorStatus.INITIALIZED)
         self.assertTrue(manager.state['network_status'])
 
     @patch('module.translator_manager.TranslationRecognizerRealtime')
@@ -116,7 +122,7 @@ class TestTranslatorManager(unittest.TestCase):
 
         # 验证状态变化
         self.assertTrue(manager.state['running'])
-        self.assertEqual(manager.state['translator_status'], "running")
+        self.assertEqual(manager.state['translator_status'], TranslatorStatus.RUNNING)
 
         # 验证翻译器启动方法是否被调用
         mock_translator_instance.start.assert_called_once()
@@ -142,7 +148,7 @@ class TestTranslatorManager(unittest.TestCase):
 
         # 验证状态变化
         self.assertFalse(manager.state['running'])
-        self.assertEqual(manager.state['translator_status'], "stopped")
+        self.assertEqual(manager.state['translator_status'], TranslatorStatus.STOPPED)
 
         # 验证翻译器停止方法是否被调用
         mock_translator_instance.stop.assert_called_once()
@@ -160,7 +166,7 @@ class TestTranslatorManager(unittest.TestCase):
         manager.start()
 
         # 创建测试音频数据
-        audio_data = np.array([[0, 1], [2, 3]], dtype=np.int16)
+        audio_data = _TEST_AUDIO_I16
 
         # 处理音频
         manager.process_audio(audio_data)
@@ -171,6 +177,139 @@ class TestTranslatorManager(unittest.TestCase):
         # 停止管理器
         manager.stop()
 
+    @patch('module.translator_manager.TranslationRecognizerRealtime')
+    @patch('module.translator_manager.TranslationCallback')
+    def test_process_audio_enqueues_bytes(self, mock_callback, mock_translator):
+        """测试音频数据以单声道连续字节形式放入缓冲区"""
+        # 创建管理器，不启动消费线程
+        manager = TranslatorManager(self.config, self.logger, self.realtime_callback)
+        manager.state['running'] = True
+
+        # 立体声数据应先转换为单声道
+        audio_data = np.array([[0, 2], [4, 6]], dtype=np.int16)
+        manager.process_audio(audio_data)
+
+        queued = manager.audio_buffer.get_nowait()
+        self.assertIsInstance(queued, bytes)
+        self.assertEqual(queued, np.array([[1], [5]], dtype=np.int16).tobytes())
+
+    @patch('module.translator_manager.TranslationRecognizerRealtime')
+    @patch('module.translator_manager.TranslationCallback')
+    def test_drain_batch_merges_ready_frames(self, mock_callback, mock_translator):
+        """测试_drain_batch合并缓冲区中已就绪的音频帧"""
+        manager = TranslatorManager(self.config, self.logger, self.realtime_callback)
+        manager.audio_buffer.put(b'\x03\x04')
+        manager.audio_buffer.put(b'\x05\x06')
+
+        batch = manager._drain_batch(b'\x01\x02')
+
+        self.assertEqual(batch, b'\x01\x02\x03\x04\x05\x06')
+        self.assertTrue(manager.audio_buffer.empty())
+
+    @patch('module.translator_manager.TranslationRecognizerRealtime')
+    @patch('module.translator_manager.TranslationCallback')
+    def test_drain_batch_single_frame(self, mock_callback, mock_translator):
+        """测试缓冲区无后续帧时_drain_batch原样返回首帧"""
+        manager = TranslatorManager(self.config, self.logger, self.realtime_callback)
+        frame = b'\x01\x02'
+
+        self.assertIs(manager._drain_batch(frame), frame)
+
+    @patch('module.translator_manager.TranslationRecognizerRealtime')
+    @patch('module.translator_manager.TranslationCallback')
+    def test_drain_batch_respects_limits(self, mock_callback, mock_translator):
+        """测试_drain_batch遵守字节数和帧数上限"""
+        manager = TranslatorManager(self.config, self.logger, self.realtime_callback)
+
+        # 使用自定义队列记录取帧次数
+        class CustomQueue:
+            def __init__(self):
+                self.items = [b'\x00' * 4 for _ in range(10)]
+
+            def get_nowait(self):
+                if self.items:
+                    return self.items.pop()
+                raise queue.Empty()
+
+        manager.audio_buffer = CustomQueue()
+        batch = manager._drain_batch(b'\x00' * 4, max_bytes=12)
+        self.assertEqual(len(batch), 12)
+        self.assertEqual(len(manager.audio_buffer.items), 8)
+
+        batch = manager._drain_batch(b'\x00' * 4, max_frames=2)
+        self.assertEqual(len(batch), 8)
+        self.assertEqual(len(manager.audio_buffer.items), 7)
+
+    @patch('module.translator_manager.TranslationRecognizerRealtime')
+    @patch('module.translator_manager.TranslationCallback')
+    def test_stop_wakes_processing_thread(self, mock_callback, mock_translator):
+        """测试stop唤醒阻塞等待音频数据的处理线程，使其立即退出"""
+        manager = TranslatorManager(self.config, self.logger, self.realtime_callback)
+        manager.start()
+
+        # 等待处理线程进入阻塞的get
+        time.sleep(0.05)
+        start_time = time.monotonic()
+        manager.stop()
+
+        # 无需等待get超时（0.5秒）
+        self.assertLess(time.monotonic() - start_time, 0.4)
+        self.assertFalse(manager.threads['processing'].is_alive())
+        self.assertTrue(manager.audio_buffer.empty())
+
+    @patch('module.translator_manager.TranslationRecognizerRealtime')
+    @patch('module.translator_manager.TranslationCallback')
+    def test_drain_batch_stops_at_wakeup_frame(self, mock_callback, mock_translator):
+        """测试_drain_batch遇到唤醒标记时停止合并"""
+        manager = TranslatorManager(self.config, self.logger, self.realtime_callback)
+        manager.audio_buffer.put(_WAKEUP_FRAME)
+        manager.audio_buffer.put(b'\x03\x04')
+
+        self.assertEqual(manager._drain_batch(b'\x01\x02'), b'\x01\x02')
+
+    @patch('module.translator_manager.TranslationRecognizerRealtime')
+    @patch('module.translator_manager.TranslationCallback')
+    def test_translator_setter_caches_send(self, mock_callback, mock_translator):
+        """测试设置翻译器时缓存其send_audio_frame方法"""
+        manager = TranslatorManager(self.config, self.logger, self.realtime_callback)
+        self.assertEqual(manager._send, mock_translator.return_value.send_audio_frame)
+
+        fake_translator = FakeTranslator()
+        manager.translator = fake_translator
+        self.assertIs(manager.translator, fake_translator)
+        manager._send(b'\x01')
+        self.assertEqual(fake_translator.frames, [b'\x01'])
+
+        manager.translator = None
+        self.assertIsNone(manager._send)
+
+    @patch('module.translator_manager.TranslationRecognizerRealtime')
+    @patch('module.translator_manager.TranslationCallback')
+    def test_consume_audio_buffer_uses_reassigned_translator(self, mock_callback, mock_translator):
+        """测试处理循环运行中更换翻译器后，下一批音频发送给新的翻译器"""
+        manager = TranslatorManager(self.config, self.logger, self.realtime_callback)
+        manager.state = TranslatorState(running=True, translator_status=TranslatorStatus.RUNNING)
+        old_translator = FakeTranslator()
+        new_translator = FakeTranslator()
+        manager.translator = old_translator
+        manager.audio_buffer.put(b'\x01')
+
+        checks = []
+        def swap_then_stop():
+            # 第一批发送后更换翻译器并放入下一批音频，第三次检查时停止循环
+            checks.append(None)
+            if len(checks) == 2:
+                manager.translator = new_translator
+                manager.audio_buffer.put(b'\x02')
+            return len(checks) > 2
+
+        manager._stop_event = MagicMock()
+        manager._stop_event.is_set.side_effect = swap_then_stop
+        manager._consume_audio_buffer()
+
+        self.assertEqual(old_translator.frames, [b'\x01'])
+        self.assertEqual(new_translator.frames, [b'\x02'])
+
     @patch('module.translator_manager.TranslationRecognizerRealtime')
     @patch('module.translator_manager.TranslationCallback')
     def test_on_network_error(self, mock_callback, mock_translator):
@@ -261,7 +400,7 @@ class TestTranslatorManager(unittest.TestCase):
         manager.start()
 
         # 验证状态是否更新为error
-        self.assertEqual(manager.state['translator_status'], "error")
+        self.assertEqual(manager.state['translator_status'], TranslatorStatus.ERROR)
 
         # 验证错误日志是否被记录
         self.logger.error.assert_called()
@@ -352,10 +491,9 @@ class TestTranslatorManager(unittest.TestCase):
         manager.state['running'] = True
 
         # 模拟stop方法抛出异常
-        manager.stop = MagicMock(side_effect=RuntimeError("Stop error"))
-
-        # 调用_on_network_error方法
-        manager._on_network_error("Test network error")
+        with patch.object(TranslatorManager, 'stop', side_effect=RuntimeError("Stop error")):
+            # 调用_on_network_error方法
+            manager._on_network_error("Test network error")
 
         # 验证错误日志是否被记录
         self.logger.error.assert_called()
@@ -464,7 +602,7 @@ class TestTranslatorManager(unittest.TestCase):
         manager.start()
 
         # 验证状态是否正确设置为error
-        self.assertEqual(manager.state['translator_status'], "error")
+        self.assertEqual(manager.state['translator_status'], TranslatorStatus.ERROR)
 
     @patch('module.translator_manager.TranslationRecognizerRealtime')
     @patch('module.translator_manager.TranslationCallback')
@@ -482,7 +620,7 @@ class TestTranslatorManager(unittest.TestCase):
         # 模拟audio_buffer.put引发Full异常
         with patch.object(manager.audio_buffer, 'put', side_effect=queue.Full):
             # 创建测试音频数据
-            audio_data = np.array([[0, 1], [2, 3]], dtype=np.int16)
+            audio_data = _TEST_AUDIO_I16
             # 重置警告调用记录
             self.logger.warning.reset_mock()
             # 调用process_audio触发缓冲区满的情况
@@ -520,7 +658,7 @@ class TestTranslatorManager(unittest.TestCase):
         manager.start()
 
         # 添加音频数据到缓冲区
-        audio_data = np.array([[0, 1], [2, 3]], dtype=np.int16)
+        audio_data = _TEST_AUDIO_I16
         manager.process_audio(audio_data)
 
         # 等待处理线程执行
@@ -558,7 +696,7 @@ class TestTranslatorManager(unittest.TestCase):
         manager.config.HEARTBEAT_INTERVAL = original_interval
 
         # 验证状态是否正确更新
-        self.assertEqual(manager.state['translator_status'], "disconnected")
+        self.assertEqual(manager.state['translator_status'], TranslatorStatus.DISCONNECTED)
         self.assertFalse(manager.state['running'])
         self.assertFalse(manager.state['network_status'])
 
@@ -617,7 +755,7 @@ class TestTranslatorManager(unittest.TestCase):
 
         # 模拟audio_data引发异常
         with patch('numpy.mean', side_effect=ValueError("Invalid array")):
-            audio_data = np.array([[0, 1], [2, 3]], dtype=np.int16)
+            audio_data = _TEST_AUDIO_I16
             manager.process_audio(audio_data)
 
         manager.stop()
@@ -836,7 +974,7 @@ class TestTranslatorManager(unittest.TestCase):
         manager.state['running'] = False
 
         # 处理音频
-        audio_data = np.array([[0, 1], [2, 3]], dtype=np.int16)
+        audio_data = _TEST_AUDIO_I16
         manager.process_audio(audio_data)
 
         # 验证缓冲区仍然为空（因为未运行）
@@ -879,7 +1017,7 @@ class TestTranslatorManager(unittest.TestCase):
         # 我们需要模拟audio_buffer.get抛出queue.Empty异常
         with patch.object(manager.audio_buffer, 'get', side_effect=queue.Empty):
             # 运行一次循环迭代
-            original_state = manager.state.copy()
+            original_state = copy.copy(manager.state)
             try:
                 # 这是一个简化的测试，我们只验证状态变化
                 manager.state['translator_status'] = "error"
@@ -909,7 +1047,7 @@ class TestTranslatorManager(unittest.TestCase):
         # 验证警告日志被记录
         self.logger.warning.assert_called()
         # 验证状态被设置为stopped
-        self.assertEqual(manager.state['translator_status'], "stopped")
+        self.assertEqual(manager.state['translator_status'], TranslatorStatus.STOPPED)
 
     @patch('module.translator_manager.TranslationRecognizerRealtime')
     @patch('module.translator_manager.TranslationCallback')
@@ -930,7 +1068,7 @@ class TestTranslatorManager(unittest.TestCase):
         # 验证错误日志被记录
         self.logger.error.assert_called()
         # 验证状态被设置为error
-        self.assertEqual(manager.state['translator_status'], "error")
+        self.assertEqual(manager.state['translator_status'], TranslatorStatus.ERROR)
 
     @patch('module.translator_manager.TranslationRecognizerRealtime')
     @patch('module.translator_manager.TranslationCallback')
@@ -948,7 +1086,7 @@ class TestTranslatorManager(unittest.TestCase):
         # 模拟audio_buffer.get方法抛出RuntimeError异常
         with patch.object(manager.audio_buffer, 'get', side_effect=RuntimeError("Buffer error")):
             # 模拟stop方法
-            with patch.object(manager, 'stop') as mock_stop:
+            with patch.object(TranslatorManager, 'stop') as mock_stop:
                 # 直接调用_consume_audio_buffer方法，由于running=True会触发一次迭代
                 # 但是由于我们模拟了get抛出异常，应该会触发stop
                 # 为了避免线程问题，我们需要先设置running=False
@@ -980,7 +1118,7 @@ class TestTranslatorManager(unittest.TestCase):
         # 验证警告日志被记录
         self.logger.warning.assert_called()
         # 验证状态被设置为stopped
-        self.assertEqual(manager.state['translator_status'], "stopped")
+        self.assertEqual(manager.state['translator_status'], TranslatorStatus.STOPPED)
 
     @patch('module.translator_manager.TranslationRecognizerRealtime')
     @patch('module.translator_manager.TranslationCallback')
@@ -1027,7 +1165,7 @@ class TestTranslatorManager(unittest.TestCase):
 
         # 验证在这种状态下，_consume_audio_buffer应该不会尝试处理音频
         # 这里我们不实际调用该方法，而是验证状态设置
-        self.assertEqual(manager.state['translator_status'], "error")
+        self.assertEqual(manager.state['translator_status'], TranslatorStatus.ERROR)
 
     @patch('module.translator_manager.TranslationRecognizerRealtime')
     @patch('module.translator_manager.TranslationCallback')
@@ -1042,7 +1180,7 @@ class TestTranslatorManager(unittest.TestCase):
 
         # 直接设置停止事件来避免线程
         stop_thread = threading.Thread(target=lambda:
-            [time.sleep(0.1), manager._stop_event.set(), manager.state.update({'running': False})])
+            [time.sleep(0.1), manager._stop_event.set(), setattr(manager.state, 'running', False)])
         stop_thread.start()
 
         try:
@@ -1060,7 +1198,7 @@ class TestTranslatorManager(unittest.TestCase):
         manager.state['translator_status'] = "error"  # 设置为错误状态
 
         # 模拟有音频数据
-        test_audio = np.array([[1, 2], [3, 4]], dtype=np.int16)
+        test_audio = _TEST_AUDIO_BYTES
         manager.audio_buffer.put(test_audio)
 
         # 设置停止事件
@@ -1080,7 +1218,6 @@ class TestTranslatorManager(unittest.TestCase):
         manager = TranslatorManager(self.config, self.logger, self.realtime_callback)
         manager.state['running'] = True
         manager.state['translator_status'] = "initialized"
-        manager.stop = MagicMock()
 
         # 设置停止事件但不立即触发，让异常处理有机会执行
         manager._stop_event = threading.Event()
@@ -1093,14 +1230,15 @@ class TestTranslatorManager(unittest.TestCase):
                 raise IOError("IO Error")
             raise queue.Empty
 
-        with patch.object(manager.audio_buffer, 'get', side_effect=get_with_error):
+        with patch.object(manager.audio_buffer, 'get', side_effect=get_with_error), \
+                patch.object(TranslatorManager, 'stop') as mock_stop:
             try:
                 manager._consume_audio_buffer()
             except Exception:
                 pass  # 忽略异常
 
             # 验证stop方法被调用
-            manager.stop.assert_called_once()
+            mock_stop.assert_called_once()
 
     @patch('module.translator_manager.TranslationRecognizerRealtime')
     @patch('module.translator_manager.TranslationCallback')
@@ -1126,7 +1264,7 @@ class TestTranslatorManager(unittest.TestCase):
         manager.start()
 
         # 添加数据到缓冲区
-        test_audio = np.array([[1, 2], [3, 4]], dtype=np.int16)
+        test_audio = _TEST_AUDIO_BYTES
         manager.audio_buffer.put(test_audio)
 
         # 调用stop方法
@@ -1166,7 +1304,7 @@ class TestTranslatorManager(unittest.TestCase):
                 manager._consume_audio_buffer()
 
             # 验证状态被设置为error
-            self.assertEqual(manager.state['translator_status'], "error")
+            self.assertEqual(manager.state['translator_status'], TranslatorStatus.ERROR)
         except Exception:
             pass  # 忽略异常
 
@@ -1195,7 +1333,7 @@ class TestTranslatorManager(unittest.TestCase):
             # 验证翻译器start方法被调用
             mock_translator_instance.start.assert_called_once()
             # 验证状态被设置为running
-            self.assertEqual(manager.state['translator_status'], "running")
+            self.assertEqual(manager.state['translator_status'], TranslatorStatus.RUNNING)
         except Exception:
             pass  # 忽略异常
 
@@ -1212,7 +1350,7 @@ class TestTranslatorManager(unittest.TestCase):
         manager.translator = mock_translator_instance
 
         # 添加数据到缓冲区
-        test_audio = np.array([[1, 2], [3, 4]], dtype=np.int16)
+        test_audio = _TEST_AUDIO_BYTES
         manager.audio_buffer.put(test_audio)
 
         # 调用_stop_translator方法
@@ -1231,7 +1369,7 @@ class TestTranslatorManager(unittest.TestCase):
         manager.state['running'] = True  # 确保管理器处于运行状态，这样process_audio才会处理音频
 
         # 准备测试音频
-        test_audio = np.array([[1, 2], [3, 4]], dtype=np.int16)
+        test_audio = _TEST_AUDIO_I16
 
         # 调用process_audio
         manager.process_audio(test_audio)
@@ -1250,7 +1388,7 @@ class TestTranslatorManager(unittest.TestCase):
 
         # 添加多个数据到缓冲区
         for i in range(3):
-            test_audio = np.array([[i, i+1], [i+2, i+3]], dtype=np.int16)
+            test_audio = np.array([[i, i+1], [i+2, i+3]], dtype=np.int16).tobytes()
             manager.audio_buffer.put(test_audio)
 
         # 调用stop方法
@@ -1292,12 +1430,12 @@ class TestTranslatorManager(unittest.TestCase):
         manager._stop_event = threading.Event()
 
         # 设置较短的检查间隔
-        original_interval = manager.config.get('connection_check_interval', 5)
-        manager.config['connection_check_interval'] = 0.1  # 100ms检查一次
+        original_interval = manager.config.HEARTBEAT_INTERVAL
+        manager.config.HEARTBEAT_INTERVAL = 0.1  # 100ms检查一次
 
         # 启动一个线程来设置停止事件
         stop_thread = threading.Thread(target=lambda:
-            [time.sleep(0.2), manager._stop_event.set(), manager.state.update({'running': False})])
+            [time.sleep(0.2), manager._stop_event.set(), setattr(manager.state, 'running', False)])
         stop_thread.start()
 
         try:
@@ -1305,7 +1443,7 @@ class TestTranslatorManager(unittest.TestCase):
             manager._check_connection()
         finally:
             # 恢复原始配置
-            manager.config['connection_check_interval'] = original_interval
+            manager.config.HEARTBEAT_INTERVAL = original_interval
             stop_thread.join()
 
     @patch('module.translator_manager.TranslationRecognizerRealtime')
@@ -1330,7 +1468,7 @@ class TestTranslatorManager(unittest.TestCase):
         manager.state['translator_status'] = "error"
 
         # 添加音频数据
-        test_audio = np.array([[1, 2], [3, 4]], dtype=np.int16)
+        test_audio = _TEST_AUDIO_BYTES
         manager.audio_buffer.put(test_audio)
 
         # 设置停止事件
@@ -1356,7 +1494,7 @@ class TestTranslatorManager(unittest.TestCase):
         manager.translator = mock_translator_instance
 
         # 添加音频数据
-        test_audio = np.array([[1, 2], [3, 4]], dtype=np.int16)
+        test_audio = _TEST_AUDIO_BYTES
         manager.audio_buffer.put(test_audio)
 
         # 调用_stop_translator方法，应该能处理异常
@@ -1377,7 +1515,7 @@ class TestTranslatorManager(unittest.TestCase):
         manager._stop_event.set()  # 立即停止
 
         # 模拟有音频数据但因为网络状态不处理
-        test_audio = np.array([[1, 2], [3, 4]], dtype=np.int16)
+        test_audio = _TEST_AUDIO_BYTES
         manager.audio_buffer.put(test_audio)
 
         try:
@@ -1400,7 +1538,7 @@ class TestTranslatorManager(unittest.TestCase):
         manager._stop_event.set()  # 立即停止
 
         # 模拟有音频数据但因为处理暂停不处理
-        test_audio = np.array([[1, 2], [3, 4]], dtype=np.int16)
+        test_audio = _TEST_AUDIO_BYTES
         manager.audio_buffer.put(test_audio)
 
         try:
@@ -1417,15 +1555,15 @@ class TestTranslatorManager(unittest.TestCase):
         manager.state['running'] = True
         manager.state['network_status'] = True  # 初始网络状态为true
         manager._stop_event = threading.Event()
-        manager.config['connection_check_interval'] = 0.1  # 100ms检查一次
+        manager.config.HEARTBEAT_INTERVAL = 0.1  # 100ms检查一次
 
         # 启动线程来改变网络状态并停止检查
         def change_network_and_stop():
             time.sleep(0.1)  # 等待一小段时间
-            manager.state.update({'network_status': False})  # 改变网络状态
+            manager.state['network_status'] = False  # 改变网络状态
             time.sleep(0.2)  # 等待检测到变化
             manager._stop_event.set()  # 设置停止事件
-            manager.state.update({'running': False})  # 停止运行
+            manager.state['running'] = False  # 停止运行
 
         stop_thread = threading.Thread(target=change_network_and_stop)
         stop_thread.start()
@@ -1452,7 +1590,7 @@ class TestTranslatorManager(unittest.TestCase):
         # 启动线程来改变网络状态并设置停止事件
         def change_network_and_stop():
             time.sleep(0.1)  # 等待一小段时间让代码运行
-            manager.state.update({'network_status': False})  # 改变网络状态
+            manager.state['network_status'] = False  # 改变网络状态
             time.sleep(0.1)  # 再等待一小段时间
             manager._stop_event.set()  # 设置停止事件
 
@@ -1461,7 +1599,7 @@ class TestTranslatorManager(unittest.TestCase):
 
         try:
             # 添加音频数据
-            test_audio = np.array([[1, 2], [3, 4]], dtype=np.int16)
+            test_audio = _TEST_AUDIO_BYTES
             manager.audio_buffer.put(test_audio)
 
             # 调用_consume_audio_buffer
@@ -1490,7 +1628,7 @@ class TestTranslatorManager(unittest.TestCase):
         # 启动线程来改变暂停状态并设置停止事件
         def change_pause_and_stop():
             time.sleep(0.1)  # 等待一小段时间
-            manager.state.update({'audio_processing_paused': False})  # 恢复处理
+            manager.state['audio_processing_paused'] = False  # 恢复处理
             time.sleep(0.1)  # 再等待一小段时间
             manager._stop_event.set()  # 设置停止事件
 
@@ -1499,7 +1637,7 @@ class TestTranslatorManager(unittest.TestCase):
 
         try:
             # 添加音频数据
-            test_audio = np.array([[1, 2], [3, 4]], dtype=np.int16)
+            test_audio = _TEST_AUDIO_BYTES
             manager.audio_buffer.put(test_audio)
 
             # 调用_consume_audio_buffer
@@ -1515,8 +1653,8 @@ class TestTranslatorManager(unittest.TestCase):
         manager = TranslatorManager(self.config, self.logger, self.realtime_callback)
 
         # 添加多个音频数据到缓冲区
-        test_audio1 = np.array([[1, 2], [3, 4]], dtype=np.int16)
-        test_audio2 = np.array([[5, 6], [7, 8]], dtype=np.int16)
+        test_audio1 = _TEST_AUDIO_BYTES
+        test_audio2 = np.array([[5, 6], [7, 8]], dtype=np.int16).tobytes()
         manager.audio_buffer.put(test_audio1)
         manager.audio_buffer.put(test_audio2)
 
@@ -1533,9 +1671,14 @@ class TestTranslatorManager(unittest.TestCase):
     @patch('module.translator_manager.TranslationCallback')
     def test_consume_audio_buffer_with_translator_initialized_start_failure(self, mock_callback, mock_translator):
         """测试_consume_audio_buffer中翻译器初始化状态但启动失败的情况（覆盖338-346行）"""
+        # 启动翻译器时先设置停止事件再抛出异常，使循环在本次迭代后确定性地退出
+        def start_and_stop():
+            manager._stop_event.set()
+            raise RuntimeError("模拟启动失败")
+
         # 创建模拟翻译器实例
         mock_translator_instance = MagicMock()
-        mock_translator_instance.start.side_effect = RuntimeError("模拟启动失败")
+        mock_translator_instance.start.side_effect = start_and_stop
         mock_translator.return_value = mock_translator_instance
 
         # 创建管理器
@@ -1547,28 +1690,16 @@ class TestTranslatorManager(unittest.TestCase):
         # 设置停止事件
         manager._stop_event = threading.Event()
 
-        # 启动线程来设置停止事件
-        def stop_later():
-            time.sleep(0.1)  # 等待一小段时间
-            manager._stop_event.set()  # 设置停止事件
-
-        stop_thread = threading.Thread(target=stop_later)
-        stop_thread.start()
-
-        try:
-            # 添加音频数据
-            test_audio = np.array([[1, 2], [3, 4]], dtype=np.int16)
-            manager.audio_buffer.put(test_audio)
+        # 添加音频数据
+        manager.audio_buffer.put(_TEST_AUDIO_BYTES)
 
-            # 调用_consume_audio_buffer
-            manager._consume_audio_buffer()
+        # 调用_consume_audio_buffer
+        manager._consume_audio_buffer()
 
-            # 验证翻译器状态变为error
-            self.assertEqual(manager.state['translator_status'], "error")
-            # 验证翻译器start方法被调用
-            mock_translator_instance.start.assert_called_once()
-        finally:
-            stop_thread.join()
+        # 验证翻译器状态变为error
+        self.assertEqual(manager.state['translator_status'], TranslatorStatus.ERROR)
+        # 验证翻译器start方法被调用
+        mock_translator_instance.start.assert_called_once()
 
     @patch('module.translator_manager.TranslationRecognizerRealtime')
     @patch('module.translator_manager.TranslationCallback')
@@ -1588,27 +1719,55 @@ class TestTranslatorManager(unittest.TestCase):
         manager.state['translator_status'] = "initialized"  # 翻译器处于初始化状态
 
         # 直接测试关键代码块
-        if manager.state['translator_status'] != "running" and manager.state['translator_status'] == "initialized":
+        if (manager.state['translator_status'] is not TranslatorStatus.RUNNING and
+                manager.state['translator_status'] is TranslatorStatus.INITIALIZED):
             try:
                 manager.translator.start()
                 manager.state['translator_status'] = "running"
             except RuntimeError as e:
                 # 这正是我们要测试的340-341行的代码
-                error_msg = self.config.LANGUAGE_CONFIG.get("translator_start_failed", "翻译器启动失败: {error}").format(error=str(e))
-                mock_logger.error(error_msg)
-                manager.state['translator_status'] = "error"
+                manager._handle_translator_start_error(e)
 
         # 验证翻译器状态变为error
-        self.assertEqual(manager.state['translator_status'], "error")
+        self.assertEqual(manager.state['translator_status'], TranslatorStatus.ERROR)
         # 验证翻译器start方法被调用
         mock_translator_instance.start.assert_called_once()
         # 验证logger.error被调用
         mock_logger.error.assert_called_once()
 
+    @patch('module.translator_manager.TranslationRecognizerRealtime')
+    @patch('module.translator_manager.TranslationCallback')
+    def test_format_start_error_cache(self, mock_callback, mock_translator):
+        """测试启动错误消息按异常类型和参数缓存"""
+        manager = TranslatorManager(self.config, self.logger, self.realtime_callback)
+        expected = INFO.get("translator_start_failed", self.config.LANGUAGE).format(error="boom")
+
+        first = manager._format_start_error(RuntimeError("boom"))
+        second = manager._format_start_error(RuntimeError("boom"))
+        self.assertEqual(first, expected)
+        self.assertIs(first, second)
+        self.assertEqual(len(manager._err_cache), 1)
+
+        # 不可哈希的参数直接格式化，不进入缓存
+        manager._format_start_error(RuntimeError(["unhashable"]))
+        self.assertEqual(len(manager._err_cache), 1)
+
+    @patch('module.translator_manager.TranslationRecognizerRealtime')
+    @patch('module.translator_manager.TranslationCallback')
+    def test_format_start_error_cache_eviction(self, mock_callback, mock_translator):
+        """测试启动错误消息缓存超出上限时淘汰最早的条目"""
+        manager = TranslatorManager(self.config, self.logger, self.realtime_callback)
+        for i in range(3):
+            manager._format_start_error(RuntimeError(i), max_entries=2)
+
+        self.assertEqual(len(manager._err_cache), 2)
+        self.assertNotIn((RuntimeError, (0,)), manager._err_cache)
+        self.assertIn((RuntimeError, (2,)), manager._err_cache)
+
     @patch('module.translator_manager.TranslationRecognizerRealtime')
     @patch('module.translator_manager.TranslationCallback')
     def test_coverage_for_line_273_274_and_509_510(self, mock_callback, mock_translator):
-        """直接测试_stop_translator和stop方法中的缓冲区清空代码行（覆盖273-274和509-510行）"""
+        """测试_stop_translator和stop方法共用的_clear_audio_buffer缓冲区清空逻辑"""
         # 创建管理器
         manager = TranslatorManager(self.config, self.logger, self.realtime_callback)
 
@@ -1636,16 +1795,13 @@ class TestTranslatorManager(unittest.TestCase):
         manager.audio_buffer = custom_buffer
 
         try:
-            # 直接执行_stop_translator中的缓冲区清空逻辑
-            while not custom_buffer.empty():
-                try:
-                    custom_buffer.get_nowait()
-                except queue.Empty:
-                    pass
+            # _stop_translator与stop共用_clear_audio_buffer清空缓冲区
+            manager._clear_audio_buffer()
 
-            # 验证方法被调用
+            # 验证方法被调用且缓冲区已清空
             self.assertTrue(custom_buffer.empty_called)
             self.assertTrue(custom_buffer.get_nowait_called)
+            self.assertEqual(custom_buffer.items, [])
 
             # 测试stop方法中的缓冲区清空（509-510行）
             # 创建新的自定义队列
@@ -1696,15 +1852,42 @@ class TestTranslatorManager(unittest.TestCase):
             # 恢复原始的audio_buffer
             manager.audio_buffer = original_buffer
 
+class TestTranslatorState(unittest.TestCase):
+    """TranslatorState类的单元测试"""
+
+    def test_default_values(self):
+        """测试默认状态值"""
+        state = TranslatorState()
+        self.assertFalse(state.running)
+        self.assertEqual(state.translator_status, TranslatorStatus.INITIALIZED)
+        self.assertTrue(state.network_status)
+        self.assertFalse(state.audio_processing_paused)
+
+    def test_dict_style_access(self):
+        """测试字典式读写与属性访问一致"""
+        state = TranslatorState()
+        state['running'] = True
+        self.assertTrue(state.running)
+        state.translator_status = TranslatorStatus.ERROR
+        self.assertEqual(state['translator_status'], TranslatorStatus.ERROR)
+
+    def test_unknown_key(self):
+        """测试未知键抛出KeyError"""
+        state = TranslatorState()
+        with self.assertRaises(KeyError):
+            _ = state['unknown']
+        with self.assertRaises(KeyError):
+            state['unknown'] = 1
+
+
 class TestCodeCoverageSpecificLines(unittest.TestCase):
     """专门针对未覆盖代码行的测试类"""
 
     def setUp(self):
         # 设置基本的配置、日志记录器和回调
-        self.config = MagicMock()
-        self.config.LANGUAGE = "zh-CN"
-        self.logger = MagicMock()
-        self.realtime_callback = MagicMock()
+        self.config = FakeConfig(LANGUAGE="zh-CN")
+        self.logger = FakeLogger()
+        self.realtime_callback = FakeCallback()
 
     def test_clear_audio_buffer(self):
         """测试重构后的_clear_audio_buffer方法"""
@@ -1760,7 +1943,7 @@ class TestCodeCoverageSpecificLines(unittest.TestCase):
 
         # 保存原始的_stop_event和_stop_translator
         original_stop_event = manager._stop_event
-        original_stop_translator = manager._stop_translator
+        original_stop_translator = TranslatorManager._stop_translator
 
         # 模拟_stop_event和_stop_translator
         class MockEvent:
@@ -1776,7 +1959,7 @@ class TestCodeCoverageSpecificLines(unittest.TestCase):
             # 应用替换
             TranslatorManager._clear_audio_buffer = mock_clear_buffer
             manager._stop_event = MockEvent()
-            manager._stop_translator = mock_stop_translator
+            TranslatorManager._stop_translator = mock_stop_translator
 
             # 调用stop方法
             manager.stop()
@@ -1787,7 +1970,7 @@ class TestCodeCoverageSpecificLines(unittest.TestCase):
             # 恢复原始方法
             TranslatorManager._clear_audio_buffer = original_clear_buffer
             manager._stop_event = original_stop_event
-            manager._stop_translator = original_stop_translator
+            TranslatorManager._stop_translator = original_stop_translator
 
     def test_coverage_for_line_336_337(self):
         """专门测试translator_manager.py第336-337行的代码覆盖"""
@@ -1798,27 +1981,20 @@ class TestCodeCoverageSpecificLines(unittest.TestCase):
 
         # 创建管理器实例
         manager = TranslatorManager(self.config, self.logger, self.realtime_callback)
-        manager.state = {
-            'translator_status': 'initialized',
-            'running': True,
-            'audio_processing_paused': False,
-            'network_status': True
-        }
+        manager.state = TranslatorState(
+            translator_status='initialized',
+            running=True,
+            audio_processing_paused=False,
+            network_status=True
+        )
 
         # 创建音频缓冲区并添加数据
         manager.audio_buffer = queue.Queue()
-        audio_data = np.zeros((1024,), dtype=np.float32)
+        audio_data = _TEST_AUDIO_F32.tobytes()
         manager.audio_buffer.put(audio_data)
 
-        # 创建成功启动的翻译器类
-        class SuccessfulTranslator:
-            def start(self):
-                pass  # 成功启动，不抛出异常
-
-            def send_audio_frame(self, audio_data):
-                pass  # 模拟发送音频数据成功
-
-        manager.translator = SuccessfulTranslator()
+        # 使用成功启动的翻译器桩
+        manager.translator = FakeTranslator()
 
         # 模拟_stop_event，让它在第一次迭代后返回True
         stop_event = MagicMock()
@@ -1826,36 +2002,31 @@ class TestCodeCoverageSpecificLines(unittest.TestCase):
         stop_event.is_set.side_effect = [False, True]
         manager._stop_event = stop_event
 
-        # 模拟INFO字典
-        import module.translator_manager
-        original_info = module.translator_manager.INFO
-        module.translator_manager.INFO = {"translator_started": "专门覆盖336-337行的测试消息"}
+        # 只替换启动成功消息，其余消息仍按原INFO解析，并让管理器重新解析日志消息
+        original_get = INFO.get
+        def fake_get(key, language):
+            if key == "translator_started":
+                return "专门覆盖336-337行的测试消息"
+            return original_get(key, language)
 
-        try:
-            # 清除logger的调用历史
-            self.logger.info.reset_mock()
+        with patch.object(INFO, 'get', side_effect=fake_get):
+            manager._reload_messages()
 
             # 直接调用_consume_audio_buffer方法
-            # 这将实际执行translator_manager.py中的代码，包括336-337行
             manager._consume_audio_buffer()
 
-            # 验证状态和日志调用
-            # 注意：由于代码逻辑，状态可能不会改变，但我们至少会执行到那两行
-            self.logger.info.assert_called_with("专门覆盖336-337行的测试消息")
+        # 启动失败模板应解析为真实消息，而不是语言代码
+        self.assertEqual(manager._msg_start_failed_tmpl,
+                         INFO.get("translator_start_failed", self.config.LANGUAGE))
+        # 恢复按真实INFO解析的消息，避免测试消息残留
+        manager._reload_messages()
 
-        except Exception as e:
-            # 如果有异常，记录但继续，因为我们的目标是覆盖代码行
-            print(f"测试过程中发生异常: {e}")
-            # 仍然验证是否调用了日志
-            if hasattr(self.logger.info, 'assert_called_with'):
-                try:
-                    self.logger.info.assert_called_with("专门覆盖336-337行的测试消息")
-                except AssertionError:
-                    pass
+        # 验证音频字节原样发送给翻译器
+        self.assertEqual(manager.translator.frames, [audio_data])
 
-        finally:
-            # 恢复原始INFO字典
-            module.translator_manager.INFO = original_info
+        # 验证状态和日志调用
+        self.assertEqual(manager.state.translator_status, TranslatorStatus.RUNNING)
+        self.assertEqual(self.logger.info_calls[-1], "专门覆盖336-337行的测试消息")
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import sys
+import os
+
+# 添加上级目录到系统路径，以便正确导入module包
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from module.translator_status import TranslatorStatus, STOPPED_MASK
+
+
+class TestTranslatorStatus(unittest.TestCase):
+    """TranslatorStatus枚举的单元测试"""
+
+    def test_no_string_equality(self):
+        """测试枚举成员不与字符串相等，相等与哈希保持一致"""
+        self.assertNotEqual(TranslatorStatus.RUNNING, "running")
+        self.assertNotIn(TranslatorStatus.RUNNING, {"running"})
+        self.assertNotIn("running", {TranslatorStatus.RUNNING})
+        self.assertIn(TranslatorStatus.RUNNING, {2})
+
+    def test_integer_equality(self):
+        """测试枚举成员仍可按整数比较"""
+        self.assertEqual(TranslatorStatus.INITIALIZED, 1)
+        self.assertEqual(TranslatorStatus.RUNNING, TranslatorStatus(2))
+
+    def test_str(self):
+        """测试字符串表示为旧状态名"""
+        self.assertEqual(str(TranslatorStatus.DISCONNECTED), "disconnected")
+
+    def test_coerce(self):
+        """测试状态转换"""
+        self.assertIs(TranslatorStatus.coerce("running"), TranslatorStatus.RUNNING)
+        self.assertIs(TranslatorStatus.coerce(16), TranslatorStatus.ERROR)
+        self.assertIs(TranslatorStatus.coerce(TranslatorStatus.STOPPED), TranslatorStatus.STOPPED)
+        with self.assertRaises(KeyError):
+            TranslatorStatus.coerce("unknown")
+
+    def test_stopped_mask(self):
+        """测试停止状态掩码只匹配停止相关状态"""
+        for status in TranslatorStatus:
+            expected = status in (TranslatorStatus.STOPPING, TranslatorStatus.STOPPED)
+            self.assertEqual(bool(status & STOPPED_MASK), expected)
+
+    def test_hashable(self):
+        """测试枚举成员可作为字典键"""
+        mapping = {TranslatorStatus.RUNNING: "ok"}
+        self.assertEqual(mapping[TranslatorStatus.RUNNING], "ok")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,13 +13,57 @@ from .message_center import message_center
 from .info import INFO
 from .logger import Logger
 from .translation_callback import TranslationCallback
+from .translator_status import TranslatorStatus, STOPPED_MASK
 # pylint: disable=c-extension-no-member
 # pylint: disable=R0902
+
+# 停止时放入音频缓冲区的唤醒标记，使阻塞等待中的消费线程立即返回
+_WAKEUP_FRAME = object()
+
+
+class TranslatorState:
+    """
+    翻译器运行状态封装。
+    使用__slots__将状态存为固定属性，音频热路径上直接以属性访问，
+    同时保留字典式读写以兼容原有的state['key']用法。
+    """
+    __slots__ = ('running', 'translator_status', 'network_status', 'audio_processing_paused')
+
+    def __init__(self, running=False, translator_status=TranslatorStatus.INITIALIZED,
+                 network_status=True, audio_processing_paused=False):
+        self.running = running
+        self.translator_status = TranslatorStatus.coerce(translator_status)
+        self.network_status = network_status
+        self.audio_processing_paused = audio_processing_paused
+
+    def __getitem__(self, key):
+        """字典式读取状态"""
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        """字典式写入状态"""
+        if key not in self.__slots__:
+            raise KeyError(key)
+        if key == 'translator_status':
+            value = TranslatorStatus.coerce(value)
+        setattr(self, key, value)
+
+
 class TranslatorManager:
     """
     基于 DashScope API 的实时语音翻译器类。
     该类管理翻译器实例，处理音频数据的接收与翻译。
     """
+    __slots__ = (
+        'config', 'logger', '_translator', '_send', 'callback', 'audio_buffer', 'result_queue',
+        '_stop_event', 'callbacks', 'threads', 'state', 'message_deduplication',
+        'components', '_msg_started', '_msg_start_failed_tmpl', '_err_cache',
+        # 由TranslatorUnit在外部设置
+        'error_callback', 'warning_callback'
+    )
+
     def __init__(self, config, logger=None, realtime_callback=None):
         """
         初始化翻译器管理器
@@ -53,12 +97,7 @@ class TranslatorManager:
             'network_check': None
         }
 
-        self.state = {
-            'running': False,
-            'translator_status': "initialized",
-            'network_status': True,
-            'audio_processing_paused': False
-        }
+        self.state = TranslatorState()
 
         self.message_deduplication = {
             'last_error_message': "",
@@ -73,6 +112,9 @@ class TranslatorManager:
             'recorder': None
         }
 
+        # 预先解析热路径上使用的日志消息
+        self._reload_messages()
+
         # 初始化翻译器
         dashscope.api_key = self.config.DASHSCOPE_API_KEY
         self.callback = TranslationCallback(
@@ -84,12 +126,33 @@ class TranslatorManager:
         self.callback.set_network_error_callback(self._on_network_error)
         self.translator = self._create_translator(self.callback)
 
+    @property
+    def translator(self):
+        """翻译器实例"""
+        return self._translator
+
+    @translator.setter
+    def translator(self, value):
+        """设置翻译器实例，同时缓存其send_audio_frame方法供发送热路径使用"""
+        self._translator = value
+        self._send = value.send_audio_frame if value is not None else None
+
+    def _reload_messages(self):
+        """
+        按当前语言解析热路径日志消息，只在构造时调用一次，之后消息固定不变
+        （切换界面语言会重启程序，运行期间config.LANGUAGE不会变化）
+        """
+        self._msg_started = INFO.get("translator_started", self.config.LANGUAGE)
+        self._msg_start_failed_tmpl = INFO.get("translator_start_failed", self.config.LANGUAGE)
+        # 已格式化的启动错误消息缓存，与模板一同重建
+        self._err_cache = {}
+
     def _on_network_error(self, message):
         error_msg = INFO.get("severe_network_error", self.config.LANGUAGE).format(message=message)
         self.logger.error(error_msg)
 
         # 检查是否已经停止，避免重复调用stop()
-        if not self.state['running'] or self._stop_event.is_set():
+        if not self.state.running or self._stop_event.is_set():
             self.logger.info(INFO.get("already_stopped_state", self.config.LANGUAGE))
             return
 
@@ -183,15 +246,15 @@ class TranslatorManager:
 
     def start(self):
         """启动翻译过程，包括翻译器初始化和相关线程"""
-        self.state['running'] = True
+        self.state.running = True
         self._stop_event.clear()  # 重置停止事件
 
         # 尝试启动翻译器
-        if self.state['translator_status'] == "initialized" and self.translator:
+        if self.state.translator_status is TranslatorStatus.INITIALIZED and self.translator:
             try:
                 self.translator.start()
-                self.state['translator_status'] = "running"
-                self.logger.info(INFO.get("translator_started", self.config.LANGUAGE))
+                self.state.translator_status = TranslatorStatus.RUNNING
+                self.logger.info(self._msg_started)
             except RuntimeError as e:
                 self._handle_translator_start_error(e)
                 return
@@ -205,15 +268,16 @@ class TranslatorManager:
     def stop(self):
         """停止所有翻译器、线程及相关资源"""
         # 防止重复调用stop
-        if not self.state['running'] and self._stop_event.is_set():
+        if not self.state.running and self._stop_event.is_set():
             return
 
-        # 设置停止事件
+        # 设置停止事件，并唤醒阻塞等待音频数据的处理线程
         self._stop_event.set()
-        self.state['running'] = False
+        self.state.running = False
+        self._wake_consumer()
 
         # 暂停音频处理
-        self.state['audio_processing_paused'] = True
+        self.state.audio_processing_paused = True
 
         # 停止录音（如果有录音器引用）
         if (hasattr(self, 'components') and self.components['recorder'] and
@@ -228,31 +292,31 @@ class TranslatorManager:
                 )}{e}")
 
         # 停止翻译器，增加更严格的状态检查
-        if self.translator and self.state['translator_status'] not in ("stopped", "stopping"):
+        if self.translator and not self.state.translator_status & STOPPED_MASK:
             try:
                 # 先检查翻译器是否还在运行（如果有相关方法）
                 if hasattr(self.translator, 'is_running') and not self.translator.is_running(): # pylint: disable=E1101
                     self.logger.warning(
                         INFO.get("translator_already_stopped", self.config.LANGUAGE)
                     )
-                    self.state['translator_status'] = "stopped"
+                    self.state.translator_status = TranslatorStatus.STOPPED
                     return
 
-                self.state['translator_status'] = "stopping"  # 标记为正在停止
+                self.state.translator_status = TranslatorStatus.STOPPING  # 标记为正在停止
                 self.translator.stop()
                 self.logger.info(INFO.get("translator_stopped_success", self.config.LANGUAGE))
-                self.state['translator_status'] = "stopped"
+                self.state.translator_status = TranslatorStatus.STOPPED
             except InvalidParameter as e:
                 # 专门捕获"已停止"的异常
                 self.logger.warning(
                     f"{INFO.get('translator_already_stopped', self.config.LANGUAGE)}: {e}"
                 )
-                self.state['translator_status'] = "stopped"
+                self.state.translator_status = TranslatorStatus.STOPPED
             except (RuntimeError, IOError) as e:
                 error_msg = INFO.get("translator_stop_error", self.config.LANGUAGE)\
                     .format(error=str(e))
                 self.logger.error(error_msg)
-                self.state['translator_status'] = "error"
+                self.state.translator_status = TranslatorStatus.ERROR
 
         # 停止处理线程
         self._stop_thread(
@@ -275,8 +339,8 @@ class TranslatorManager:
         Args:
             audio_data: 原始音频数据
         """
-        if (not self.state['running'] or audio_data is None or
-                self._stop_event.is_set() or not self.state['network_status']):
+        if (not self.state.running or audio_data is None or
+                self._stop_event.is_set() or not self.state.network_status):
             return
 
         try:
@@ -284,8 +348,8 @@ class TranslatorManager:
             if audio_data.ndim == 2 and audio_data.shape[1] == 2:
                 audio_data = np.mean(audio_data, axis=1, dtype=np.int16).reshape(-1, 1)
 
-            # 放入缓冲区
-            self.audio_buffer.put(audio_data, block=True, timeout=0.5)
+            # 以连续字节放入缓冲区，消费者无需再逐帧转换
+            self.audio_buffer.put(audio_data.tobytes(), block=True, timeout=0.5)
         except queue.Full:
             warning_msg = INFO.get("audio_buffer_full", self.config.LANGUAGE)
             # 强制记录警告，不应用去重机制
@@ -302,38 +366,32 @@ class TranslatorManager:
         从缓冲区取出音频数据并发送给翻译器
         在独立线程中运行，负责音频数据的实际处理和发送
         """
-        while self.state['running'] and not self._stop_event.is_set():
+        # 每帧都会调用的方法绑定为局部变量，减少属性查找
+        # （发送方法每批重新读取self._send，运行中更换翻译器后下一批即生效）
+        stop_is_set = self._stop_event.is_set
+        next_audio_chunk = self._next_audio_chunk
+
+        while self.state.running and not stop_is_set():
             try:
-                if (self.state['audio_processing_paused'] or
-                        not self.state['network_status']):
+                if (self.state.audio_processing_paused or
+                        not self.state.network_status):
                     time.sleep(0.1)
                     continue
 
-                # 获取音频数据
-                try:
-                    audio_data = self.audio_buffer.get(timeout=0.5)
-                except queue.Empty:
-                    # 无音频数据时检查翻译器状态
-                    if self.state['translator_status'] == "initialized":
-                        try:
-                            self.translator.start()
-                            # 直接执行成功处理逻辑，避免额外的方法调用层级
-                            self.state['translator_status'] = "running"
-                            self.logger.info(INFO.get("translator_started", "翻译器已成功启动"))
-                        except RuntimeError as e:
-                            # 调用单独的错误处理方法
-                            self._handle_translator_start_error(e)
+                # 获取音频数据，没有可发送的数据时重新检查循环条件
+                audio_data = next_audio_chunk()
+                if audio_data is None:
                     continue
 
                 # 处理翻译器状态
-                if (self.state['translator_status'] != "running" or
+                if (self.state.translator_status is not TranslatorStatus.RUNNING or
                         not self.translator):
-                    if self.state['translator_status'] == "initialized":
+                    if self.state.translator_status is TranslatorStatus.INITIALIZED:
                         try:
                             self.translator.start()
                             # 内联的状态更新和日志记录
-                            self.state['translator_status'] = "running"
-                            self.logger.info(INFO.get("translator_started", "翻译器已成功启动"))
+                            self.state.translator_status = TranslatorStatus.RUNNING
+                            self.logger.info(self._msg_started)
                         except RuntimeError as e:
                             # 调用单独的错误处理方法
                             self._handle_translator_start_error(e)
@@ -342,7 +400,7 @@ class TranslatorManager:
 
                 # 发送音频数据
                 try:
-                    self.translator.send_audio_frame(audio_data.tobytes())
+                    self._send(audio_data)
                 except (ConnectionError, IOError, RuntimeError) as e:
                     error_msg = INFO.get("send_audio_failed", self.config.LANGUAGE)\
                         .format(error=str(e))
@@ -363,6 +421,69 @@ class TranslatorManager:
                 self.logger.error(error_msg)
                 self.stop()
 
+    def _next_audio_chunk(self):
+        """
+        从缓冲区取出一帧音频，并合并缓冲区中已就绪的后续帧
+        Returns:
+            待发送的音频数据；队列超时为空或取到唤醒标记时返回None
+        """
+        try:
+            audio_data = self.audio_buffer.get(timeout=0.5)
+        except queue.Empty:
+            # 无音频数据时检查翻译器状态
+            if self.state.translator_status is TranslatorStatus.INITIALIZED:
+                try:
+                    self.translator.start()
+                    # 直接执行成功处理逻辑，避免额外的方法调用层级
+                    self.state.translator_status = TranslatorStatus.RUNNING
+                    self.logger.info(self._msg_started)
+                except RuntimeError as e:
+                    # 调用单独的错误处理方法
+                    self._handle_translator_start_error(e)
+            return None
+
+        if audio_data is _WAKEUP_FRAME:
+            return None
+        return self._drain_batch(audio_data)
+
+    def _wake_consumer(self):
+        """向缓冲区放入唤醒标记，使处理线程无需等待get超时即可检查停止事件"""
+        thread = self.threads['processing']
+        if thread and thread.is_alive():
+            try:
+                self.audio_buffer.put_nowait(_WAKEUP_FRAME)
+            except queue.Full:
+                # 缓冲区已满时处理线程不会阻塞在get上，无需唤醒
+                pass
+
+    def _drain_batch(self, first_frame, max_bytes=16384, max_frames=32):
+        """
+        将缓冲区中已就绪的音频帧与首帧合并为一次发送的数据
+        只取出当前已在队列中的帧，不额外等待，因此不会增加延迟
+        Args:
+            first_frame: 已取出的首帧音频数据
+            max_bytes: 合并后的最大字节数
+            max_frames: 最多合并的帧数
+        Returns:
+            合并后的音频数据（只有一帧时原样返回）
+        """
+        frames = [first_frame]
+        total = len(first_frame)
+        get_nowait = self.audio_buffer.get_nowait
+        while total < max_bytes and len(frames) < max_frames:
+            try:
+                frame = get_nowait()
+            except queue.Empty:
+                break
+            if frame is _WAKEUP_FRAME:
+                break
+            frames.append(frame)
+            total += len(frame)
+
+        if len(frames) == 1:
+            return first_frame
+        return b''.join(frames)
+
     def _notify_connection_lost(self):
         """通知用户连接已断开"""
         error_msg = INFO.get("connection_failed", self.config.LANGUAGE)
@@ -387,7 +508,7 @@ class TranslatorManager:
 
     def _check_connection(self):
         """检查连接状态，网络中断时停止翻译"""
-        while self.state['running'] and not self._stop_event.is_set():
+        while self.state.running and not self._stop_event.is_set():
             # 短间隔检查，便于快速响应停止事件
             remaining_sleep = self.config.HEARTBEAT_INTERVAL
             while remaining_sleep > 0 and not self._stop_event.is_set():
@@ -399,10 +520,10 @@ class TranslatorManager:
                 break
 
             # 只检查状态，不进行重连
-            if (self.state['translator_status'] == "running" and
+            if (self.state.translator_status is TranslatorStatus.RUNNING and
                     self.translator):
                 try:
-                    self.translator.send_audio_frame(b'')
+                    self._send(b'')
                 except (ConnectionError, IOError, RuntimeError) as e:
                     error_msg = str(e)
                     log_msg = INFO.get("connection_check_failed", self.config.LANGUAGE)\
@@ -410,9 +531,9 @@ class TranslatorManager:
                     self.logger.error(log_msg)
 
                     # 先更新状态
-                    self.state['translator_status'] = "disconnected"
-                    self.state['running'] = False
-                    self.state['network_status'] = False
+                    self.state.translator_status = TranslatorStatus.DISCONNECTED
+                    self.state.running = False
+                    self.state.network_status = False
 
                     # 发送通知
                     self.send_error_notification(
@@ -457,9 +578,32 @@ class TranslatorManager:
 
     def _handle_translator_start_error(self, error):
         """处理翻译器启动错误的单独方法"""
-        error_msg = f"翻译器启动失败: {str(error)}"
+        error_msg = self._format_start_error(error)
         self.logger.error(error_msg)
-        self.state['translator_status'] = "error"
+        self.state.translator_status = TranslatorStatus.ERROR
+
+    def _format_start_error(self, error, max_entries=32):
+        """
+        格式化翻译器启动错误消息，相同类型和参数的错误复用已格式化的结果
+        Args:
+            error: 异常对象
+            max_entries: 缓存的最大条目数，超出时淘汰最早的条目
+        Returns:
+            格式化后的错误消息
+        """
+        key = (type(error), error.args)
+        try:
+            error_msg = self._err_cache.get(key)
+        except TypeError:
+            # 异常参数不可哈希，直接格式化
+            return self._msg_start_failed_tmpl.format(error=str(error))
+
+        if error_msg is None:
+            error_msg = self._msg_start_failed_tmpl.format(error=str(error))
+            if len(self._err_cache) >= max_entries:
+                del self._err_cache[next(iter(self._err_cache))]
+            self._err_cache[key] = error_msg
+        return error_msg
 
     def _clear_audio_buffer(self):
         """清空音频缓冲区"""
@@ -472,10 +616,10 @@ class TranslatorManager:
     def _stop_translator(self):
         """仅停止翻译器而不改变其当前状态（用于连接断开情况）"""
         # 保存当前状态，避免被stop()覆盖
-        current_status = self.state['translator_status']
+        current_status = self.state.translator_status
 
         # 停止翻译器但保持disconnected状态
-        if self.translator and self.state['translator_status'] not in ("stopped", "stopping"):
+        if self.translator and not self.state.translator_status & STOPPED_MASK:
             try:
                 # pylint: disable=no-member
                 if hasattr(self.translator, 'is_running') and not self.translator.is_running():
@@ -494,14 +638,14 @@ class TranslatorManager:
                 error_msg = INFO.get("translator_stop_error",
                                      self.config.LANGUAGE).format(error=str(e))
                 self.logger.error(error_msg)
-                self.state['translator_status'] = "error"
+                self.state.translator_status = TranslatorStatus.ERROR
 
         # 清空音频缓冲区
         self._clear_audio_buffer()
 
         # 恢复原始状态（例如disconnected）
-        if current_status == "disconnected":
-            self.state['translator_status'] = "disconnected"
+        if current_status is TranslatorStatus.DISCONNECTED:
+            self.state.translator_status = TranslatorStatus.DISCONNECTED
 
     def set_recorder(self, recorder):
         """
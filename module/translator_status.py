@@ -0,0 +1,33 @@
+"""
+翻译器状态枚举模块
+以整数枚举表示翻译器状态，热路径上可直接按成员身份比较，
+状态集合判断使用位掩码。原有的字符串状态（如"running"、"error"）
+在写入时通过coerce转换为枚举成员，成员本身只按整数比较，保持相等与哈希一致。
+"""
+from enum import IntEnum
+
+
+class TranslatorStatus(IntEnum):
+    """翻译器状态枚举，取值为互不重叠的位标志，便于按掩码判断状态集合"""
+    INITIALIZED = 1
+    RUNNING = 2
+    STOPPING = 4
+    STOPPED = 8
+    ERROR = 16
+    DISCONNECTED = 32
+
+    def __str__(self):
+        return self.name.lower()
+
+    @classmethod
+    def coerce(cls, value):
+        """将字符串或整数状态转换为枚举成员"""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            return cls[value.upper()]
+        return cls(value)
+
+
+# 已停止或正在停止的状态掩码
+STOPPED_MASK = TranslatorStatus.STOPPING | TranslatorStatus.STOPPED